@@ -2,33 +2,32 @@
 
 import logging
 import math
-import pdb
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from turtle import color
+from typing import TYPE_CHECKING, Any
 
-import matplotlib.dates as mdates
-import matplotlib.ticker as mticker
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
-from mrimagetools.filters.multiecho_thermometry_filter import (
-    R_SQUARED_THRESHOLD,
-    thermometry_signal_model,
-)
-from mrimagetools.pipelines.thermometry.multiecho_thermometry import (
-    multiecho_thermometry,
-)
-from pyparsing import alphanums, col
 from rich.console import Console
 
 from ethylene_glycol_phantom_thermometry.util import (
+    BidsSidecar,
+    SeriesData,
+    find_nifti_for_sidecar,
     get_project_root,
     load_bids_sidecars_from_directory,
     load_series_info,
 )
 
+# pandas, matplotlib and mrimagetools are imported where they are used, so that
+# importing this module (e.g. for the CLI) stays fast
+if TYPE_CHECKING:
+    import pandas as pd
+
 PROJECT_ROOT = get_project_root()
 DATA_DIR = PROJECT_ROOT / "data"
 
@@ -51,223 +50,249 @@ REGION_COLOURS = {
 }
 
 
-def analysis(
-    data_dir: Path, method: Method = Method.REGIONWISE, n_bootstrap: int = 10
-) -> None:
-    """Performs batch analysis of multi-echo MR thermometry data.
+@dataclass
+class RunResult:
+    """A dataclass for the results of processing a single run."""
 
-    This function orchestrates the entire analysis pipeline for a given dataset
-    directory. It reads series information from an Excel file and BIDS sidecars,
-    groups data by experimental runs, and processes each run using the
-    `multiecho_thermometry` pipeline.
+    run: int
+    midpoint_time: datetime
+    fibre_optic_sample_times: list[datetime]
+    fibre_optic_samples: list[float]
+    region_results: list[dict]
 
-    For each run, it generates a histogram of temperature distributions. After
-    processing all runs, it aggregates the results into an Excel spreadsheet
-    and creates a summary plot showing temperature over time for each region,
-    including fiber optic reference temperatures.
 
-    The function expects the data directory to contain:
-    - 'image_information.xlsx': An Excel file with series metadata.
-    - NIfTI image files (.nii.gz) and their corresponding BIDS JSON sidecars.
-    - Segmentation files in NIfTI format.
+def _pyplot() -> Any:
+    """Imports pyplot using the non-interactive Agg backend.
 
-    Args:
-        data_dir: The path to the directory containing the dataset.
-        method: The analysis method to use, chosen from the `Method` enum.
-            Defaults to `Method.REGIONWISE`.
-        n_bootstrap: The number of bootstrap iterations to perform if the
-            'regionwise_bootstrap' method is selected. Defaults to 10.
+    matplotlib is only imported when plots are requested, as it is slow to
+    import and the plots are written straight to file.
 
+    Returns:
+        The `matplotlib.pyplot` module.
     """
-    console.print(f"[bold blue]Starting analysis in: {data_dir}[/bold blue]")
-    image_info_file = data_dir / "image_information.xlsx"
-    series_data_list = load_series_info(image_info_file)
-    bids_sidecars = load_bids_sidecars_from_directory(data_dir)
+    import matplotlib
 
-    # map sidecars to series data
-    # find the matching sidecar (study_id and series_no), then use the sidecar
-    # filename to construct the nifti filename, assumed to be same name but .nii.gz
-    for series_data in series_data_list:
-        matching_sidecars = [
-            sc
-            for sc in bids_sidecars
-            if sc.study_id == series_data.study_id
-            and sc.series_no == series_data.series_no
+    matplotlib.use("Agg")
+    from matplotlib import pyplot as plt
+
+    return plt
+
+
+def _plot_run(
+    run: int, report_data: Any, valid_voxels: dict[int, np.ndarray], data_dir: Path
+) -> None:
+    """Plots the temperature distribution and signal fits for a single run.
+
+    Args:
+        run: The run number.
+        report_data: The report returned by `multiecho_thermometry` for the run.
+        valid_voxels: Mask of the voxels with a good fit, for each region id.
+        data_dir: The directory to save the plots to.
+    """
+    from mrimagetools.filters.multiecho_thermometry_filter import (
+        thermometry_signal_model,
+    )
+
+    plt = _pyplot()
+
+    fig = plt.figure(figsize=(10, 6))
+    hist_min = np.min(
+        [
+            np.min(region.region_temperature_values[valid_voxels[region.region_id]])
+            for region in report_data.report
         ]
-        if matching_sidecars:
-            sidecar = matching_sidecars[0]
-            nifti_filename = sidecar.filename.with_suffix(".nii.gz")
-            series_data.nifti_file = nifti_filename
-        else:
-            print(
-                f"Warning: No matching sidecar found for study {series_data.study_id},"
-                f" series {series_data.series_no}"
-            )
+    )
+    hist_max = np.max(
+        [
+            np.max(region.region_temperature_values[valid_voxels[region.region_id]])
+            for region in report_data.report
+        ]
+    )
+    bin_width = 0.5  # 0.1 °C bin width
+    hist_bins = np.arange(hist_min, hist_max + bin_width, bin_width).tolist()
+
+    for region in report_data.report:
+        # plot histograms of the temperature values
+        plt.hist(
+            region.region_temperature_values[valid_voxels[region.region_id]],
+            alpha=0.5,
+            label=f"NMR Tube {region.region_id}",
+            color=REGION_COLOURS[region.region_id],
+            # bins=hist_bins,
+            bins=20,
+        )
 
-    unique_runs = {sd.run for sd in series_data_list}
-    analysis_results = []
-    fibre_optic_sample_times: list[datetime] = []
-    fibre_optic_samples: list[float] = []
-    for run in unique_runs:
-        console.print(
-            f"[bold blue]Processing run {run} of {len(unique_runs)}[/bold blue]"
+    plt.xlabel("Temperature (°C)")
+    plt.ylabel("Count")
+    plt.title(f"Thermometry Analysis Run {run}")
+    plt.legend()
+    fig.savefig(data_dir / f"run-{run:02d}_temperature_distribution.png")
+    plt.close(fig)
+
+    # Plot all region signal samples and optimal fitted curve.
+    # The echo times are the same for every region, so the times to evaluate
+    # the fitted curve at are only computed once
+    echo_times = np.asarray(report_data.echo_times)
+    t = np.arange(0, echo_times[-1], 1e-4)
+    for region in report_data.report:
+        fig = plt.figure(figsize=(10, 6))
+        # plot every sample in a single call, pairing each row of signal values
+        # with the echo times
+        signal_values = np.asarray(region.signal_values)
+        plt.scatter(
+            np.broadcast_to(echo_times, signal_values.shape).ravel(),
+            signal_values.ravel(),
+            c=REGION_COLOURS[region.region_id],
+            marker=".",
+            alpha=0.075,
         )
-        # collect the series data for this run
-        run_series = [sd for sd in series_data_list if sd.run == run]
-        # save echo times in seconds to text files
-        te_files: list[Path] = []
-        multiecho_files: list[Path] = []
-        for sd in run_series:
-            te_s = [te / 1000.0 for te in sd.te_ms]
-            te_file = data_dir / f"run-{run:02d}_series-{sd.series_no:03d}_te_s.txt"
-            te_files.append(te_file)
-            with open(te_file, "w", encoding="utf-8") as f:
-                for te in te_s:
-                    f.write(f"{te}\n")
-            multiecho_files.append(sd.nifti_file)  # type: ignore
-
-        output_prefix = f"run-{run:02d}_thermometry"
-        _, report_data = multiecho_thermometry(
-            multiecho_nifti_files=multiecho_files,
-            echo_times_files=te_files,
-            segmentation_nifti_file=(data_dir / run_series[0].segmentation).with_suffix(
-                ".nii.gz"
-            ),
-            output_prefix=output_prefix,
-            method=method,
-            n_bootstrap=n_bootstrap,
+        mean_fit_params = np.average(
+            region.fitted_params[valid_voxels[region.region_id], :], axis=0
         )
-
-        # convert acquisition_date_time to datetime
-        # pdb.set_trace()
-        acq_dt_list = [
-            datetime.strptime(dt, "%Y-%m-%dT%H:%M:%S.%f")
-            for dt in report_data.acquisition_date_time
-        ]
-        duration_list = [sd.duration for sd in run_series if sd.duration]
-        sort_indices = np.argsort(np.asarray(acq_dt_list))
-        acq_dt_list_sorted = [acq_dt_list[i] for i in sort_indices]
-        duration_list_sorted = [duration_list[i] for i in sort_indices]
-        run_start_time = acq_dt_list_sorted[0]
-        run_end_time = acq_dt_list_sorted[-1] + timedelta(
-            seconds=duration_list_sorted[-1]
+        plt.plot(
+            t,
+            thermometry_signal_model(t, *mean_fit_params.tolist()),
+            c=REGION_COLOURS[region.region_id],
         )
+        plt.title("Signal and Fit")
+        plt.xlabel("Echo Time (s)")
+        plt.ylabel("Signal Magnitude (a.u.)")
+        fig.savefig(
+            data_dir / f"run-{run:02d}_region-{region.region_id}_signal_fit.png"
+        )
+        plt.close(fig)
 
-        # acquisition took place from first datetime to last + acquisition duration.
-        # We want to use the midpoint time
-        midpoint_time = acq_dt_list_sorted[0] + (run_end_time - run_start_time) / 2
 
-        # append the fibre optic temperature measurements - start of run and end of run.
+def _process_run(
+    run: int,
+    run_series: list[SeriesData],
+    data_dir: Path,
+    method: Method,
+    n_bootstrap: int,
+    segmentation: Path,
+    te_files: list[Path],
+    plot: bool,
+) -> RunResult:
+    """Runs the multiecho thermometry pipeline on a single run.
 
-        fibre_optic_sample_times.append(run_start_time)
-        fibre_optic_samples.append(run_series[sort_indices[0]].fo_temperature_start)
+    This is executed in a worker process, so only the summary results are
+    returned rather than the full report, which contains the per-voxel data.
 
-        fibre_optic_sample_times.append(run_end_time)
-        fibre_optic_samples.append(run_series[sort_indices[-1]].fo_temperature_end)
+    Args:
+        run: The run number.
+        run_series: The series data belonging to this run.
+        data_dir: The path to the directory containing the dataset.
+        method: The analysis method to use.
+        n_bootstrap: The number of bootstrap iterations to perform if the
+            'regionwise_bootstrap' method is selected.
+        segmentation: The path to the segmentation NIfTI file for this run.
+        te_files: The paths to the echo times files (in seconds), one for each
+            series in run_series.
+        plot: Whether to plot the temperature distribution and signal fits.
+
+    Returns:
+        The per-region results, midpoint time and fibre optic samples for the run.
+    """
+    import pandas as pd
+    from mrimagetools.filters.multiecho_thermometry_filter import R_SQUARED_THRESHOLD
+    from mrimagetools.pipelines.thermometry.multiecho_thermometry import (
+        multiecho_thermometry,
+    )
 
-        plt.figure(figsize=(10, 6))
-        hist_min = np.min(
-            [
-                np.min(
-                    region.region_temperature_values[
-                        region.r_squared > R_SQUARED_THRESHOLD
-                    ]
-                )
-                for region in report_data.report
-            ]
-        )
-        hist_max = np.max(
-            [
-                np.max(
-                    region.region_temperature_values[
-                        region.r_squared > R_SQUARED_THRESHOLD
-                    ]
-                )
-                for region in report_data.report
-            ]
-        )
-        bin_width = 0.5  # 0.1 °C bin width
-        hist_bins = np.arange(hist_min, hist_max + bin_width, bin_width).tolist()
-
-        for region in report_data.report:
-            analysis_results.append(
-                {
-                    "run": run,
-                    "time": midpoint_time,
-                    "region_id": region.region_id,
-                    "temperature": region.region_mean_temperature,
-                    "uncertainty": region.region_temperature_uncertainty[0],
-                    "interval": region.region_temperature_uncertainty[1],
-                    "num_samples": np.sum(region.r_squared > R_SQUARED_THRESHOLD),
-                    "fractional_uncertainty": region.region_temperature_uncertainty[0]
-                    / region.region_mean_temperature,
-                }
-            )
-            # plot histograms of the temperature values
-            plt.hist(
-                region.region_temperature_values[
-                    region.r_squared > R_SQUARED_THRESHOLD
-                ],
-                alpha=0.5,
-                label=f"NMR Tube {region.region_id}",
-                color=REGION_COLOURS[region.region_id],
-                # bins=hist_bins,
-                bins=20,
-            )
+    console.print(f"[bold blue]Processing run {run}[/bold blue]")
+    multiecho_files: list[Path] = [sd.nifti_file for sd in run_series]  # type: ignore
+
+    output_prefix = f"run-{run:02d}_thermometry"
+    _, report_data = multiecho_thermometry(
+        multiecho_nifti_files=multiecho_files,
+        echo_times_files=te_files,
+        segmentation_nifti_file=segmentation,
+        output_prefix=output_prefix,
+        method=method,
+        n_bootstrap=n_bootstrap,
+    )
 
-        plt.xlabel("Temperature (°C)")
-        plt.ylabel("Count")
-        plt.title(f"Thermometry Analysis Run {run}")
-        plt.legend()
-        plt.savefig(data_dir / f"run-{run:02d}_temperature_distribution.png")
-        plt.close()
-
-        # Plot all region signal samples and optimal fitted curve
-        for region in report_data.report:
-            plt.figure(figsize=(10, 6))
-            for i in range(len(region.signal_values)):
-                # pdb.set_trace()
-                plt.scatter(
-                    report_data.echo_times,
-                    region.signal_values[i, :],
-                    c=REGION_COLOURS[region.region_id],
-                    marker=".",
-                    alpha=0.075,
-                )
-            t = np.arange(0, report_data.echo_times[-1], 1e-4)
-            mean_fit_params = np.average(
-                region.fitted_params[region.r_squared > R_SQUARED_THRESHOLD, :], axis=0
-            )
-            # pdb.set_trace()
+    # convert acquisition_date_time to datetime
+    acq_dt = pd.to_datetime(
+        report_data.acquisition_date_time, format="%Y-%m-%dT%H:%M:%S.%f"
+    )
+    durations = np.fromiter(
+        (sd.duration for sd in run_series if sd.duration), dtype=np.float64
+    )
+    sort_indices = np.argsort(acq_dt.to_numpy())
+    run_start_time = acq_dt[sort_indices[0]]
+    run_end_time = acq_dt[sort_indices[-1]] + pd.to_timedelta(
+        durations[sort_indices[-1]], unit="s"
+    )
 
-            plt.plot(
-                t,
-                thermometry_signal_model(t, *mean_fit_params.tolist()),
-                c=REGION_COLOURS[region.region_id],
-            )
-            plt.title("Signal and Fit")
-            plt.xlabel("Echo Time (s)")
-            plt.ylabel("Signal Magnitude (a.u.)")
-            plt.savefig(
-                data_dir / f"run-{run:02d}_region-{region.region_id}_signal_fit.png"
-            )
-        plt.close()
+    # acquisition took place from first datetime to last + acquisition duration.
+    # We want to use the midpoint time
+    midpoint_time = run_start_time + (run_end_time - run_start_time) / 2
 
-    console.print(
-        f"[bold blue]Thermometry processing using method {method} complete[/bold blue]"
+    # the fibre optic temperature measurements - start of run and end of run.
+    fibre_optic_sample_times = [run_start_time, run_end_time]
+    fibre_optic_samples = [
+        run_series[sort_indices[0]].fo_temperature_start,
+        run_series[sort_indices[-1]].fo_temperature_end,
+    ]
+
+    # voxels with a good fit, evaluated once per region and reused below
+    valid_voxels = {
+        region.region_id: region.r_squared > R_SQUARED_THRESHOLD
+        for region in report_data.report
+    }
+
+    region_results = []
+    for region in report_data.report:
+        region_results.append(
+            {
+                "run": run,
+                "time": midpoint_time,
+                "region_id": region.region_id,
+                "temperature": region.region_mean_temperature,
+                "uncertainty": region.region_temperature_uncertainty[0],
+                "interval": region.region_temperature_uncertainty[1],
+                "num_samples": np.sum(valid_voxels[region.region_id]),
+                "fractional_uncertainty": region.region_temperature_uncertainty[0]
+                / region.region_mean_temperature,
+            }
+        )
+
+    if plot:
+        _plot_run(run, report_data, valid_voxels, data_dir)
+
+    return RunResult(
+        run=run,
+        midpoint_time=midpoint_time,
+        fibre_optic_sample_times=fibre_optic_sample_times,
+        fibre_optic_samples=fibre_optic_samples,
+        region_results=region_results,
     )
 
-    results_df = pd.DataFrame(analysis_results)
+
+def _plot_temperature_over_time(
+    results_df: "pd.DataFrame",
+    fibre_optic_sample_times: list[datetime],
+    fibre_optic_samples: list[float],
+    plot_file_stem: Path,
+) -> None:
+    """Plots the temperature of each region over time, with the fibre optic
+    reference temperatures, and saves it as png and svg.
+
+    Args:
+        results_df: The per-run, per-region results.
+        fibre_optic_sample_times: The times of the fibre optic measurements.
+        fibre_optic_samples: The fibre optic temperature measurements.
+        plot_file_stem: The path to save the plot to, without a file extension.
+    """
+    import matplotlib.dates as mdates
+    import matplotlib.ticker as mticker
+
+    plt = _pyplot()
+
     session_start_time = min(results_df["time"].iloc[0], fibre_optic_sample_times[0])
     session_end_time = max(results_df["time"].iloc[-1], fibre_optic_sample_times[-1])
     # results_df["elapsed_time"] = results_df["time"] - session_start_time
-    # pdb.set_trace()
-
-    results_file = data_dir / f"thermometry_analysis_{method}.xlsx"
-    results_df.to_excel(results_file, index=False)
-    console.print(
-        f"[bold green]Analysis complete! Results saved to {results_file}[/bold green]"
-    )
 
     def timedelta_formatter(x: float, pos: int) -> str:
         """
@@ -307,7 +332,7 @@ def analysis(
         return " ".join(parts)
 
     # make a plot of temperature vs time for each region
-    plt.figure(figsize=(10, 6))
+    fig = plt.figure(figsize=(10, 6))
     for region_id in results_df["region_id"].unique():
         region_df = results_df[results_df["region_id"] == region_id]
         plt.errorbar(
@@ -355,13 +380,155 @@ def analysis(
     plt.legend()
     plt.grid(True)
     # plt.show()
-    console.print("[bold blue]Saving plot to files[/bold blue]")
     # save the plot as png and svg
-    plot_file_png = data_dir / f"thermometry_analysis_{method}.png"
-    plot_file_svg = data_dir / f"thermometry_analysis_{method}.svg"
-    plt.savefig(plot_file_png)
-    plt.savefig(plot_file_svg)
-    plt.close()
+    fig.savefig(plot_file_stem.with_name(f"{plot_file_stem.name}.png"))
+    fig.savefig(plot_file_stem.with_name(f"{plot_file_stem.name}.svg"))
+    plt.close(fig)
+
+
+def analysis(
+    data_dir: Path,
+    method: Method = Method.REGIONWISE,
+    n_bootstrap: int = 10,
+    plot: bool = False,
+) -> None:
+    """Performs batch analysis of multi-echo MR thermometry data.
+
+    This function orchestrates the entire analysis pipeline for a given dataset
+    directory. It reads series information from an Excel file and BIDS sidecars,
+    groups data by experimental runs, and processes each run using the
+    `multiecho_thermometry` pipeline.
+
+    After processing all runs, it aggregates the results into an Excel
+    spreadsheet. If plotting is enabled, it also generates a histogram of
+    temperature distributions for each run and a summary plot showing
+    temperature over time for each region, including fiber optic reference
+    temperatures.
+
+    The function expects the data directory to contain:
+    - 'image_information.xlsx': An Excel file with series metadata.
+    - NIfTI image files (.nii or .nii.gz) and their corresponding BIDS JSON sidecars.
+      Uncompressed .nii files are used in preference, as they can be memory-mapped.
+    - Segmentation files in NIfTI format.
+
+    Args:
+        data_dir: The path to the directory containing the dataset.
+        method: The analysis method to use, chosen from the `Method` enum.
+            Defaults to `Method.REGIONWISE`.
+        n_bootstrap: The number of bootstrap iterations to perform if the
+            'regionwise_bootstrap' method is selected. Defaults to 10.
+        plot: Whether to generate the plots. Defaults to False.
+
+    """
+    import pandas as pd
+
+    console.print(f"[bold blue]Starting analysis in: {data_dir}[/bold blue]")
+    image_info_file = data_dir / "image_information.xlsx"
+    series_data_list = load_series_info(image_info_file)
+    bids_sidecars = load_bids_sidecars_from_directory(data_dir)
+    # index the sidecars by (study_id, series_no), keeping the first match
+    sidecar_index: dict[tuple[str, int], BidsSidecar] = {}
+    for sc in bids_sidecars:
+        sidecar_index.setdefault((sc.study_id, sc.series_no), sc)
+
+    # map sidecars to series data
+    # find the matching sidecar (study_id and series_no), then use the sidecar
+    # filename to construct the nifti filename, assumed to be same name but .nii
+    # or .nii.gz
+    for series_data in series_data_list:
+        sidecar = sidecar_index.get((series_data.study_id, series_data.series_no))
+        if sidecar is not None:
+            series_data.nifti_file = find_nifti_for_sidecar(sidecar.filename)
+        else:
+            print(
+                f"Warning: No matching sidecar found for study {series_data.study_id},"
+                f" series {series_data.series_no}"
+            )
+
+    # group the series data by run
+    series_by_run: dict[int, list[SeriesData]] = {}
+    for sd in series_data_list:
+        series_by_run.setdefault(sd.run, []).append(sd)
+
+    # runs are independent (distinct input files and output prefixes), so process
+    # them in parallel and gather the results in the parent process, in run order
+    run_jobs = sorted(series_by_run.items())
+    runs = [run for run, _ in run_jobs]
+    runs_series = [run_series for _, run_series in run_jobs]
+    segmentation_files = [
+        (data_dir / run_series[0].segmentation).with_suffix(".nii.gz")
+        for run_series in runs_series
+    ]
+    max_workers = min(len(run_jobs), os.cpu_count() or 1)
+    console.print(
+        f"[bold blue]Processing {len(run_jobs)} runs using {max_workers} workers[/bold blue]"
+    )
+    with (
+        tempfile.TemporaryDirectory() as tmp_dir,
+        ProcessPoolExecutor(max_workers=max_workers) as executor,
+    ):
+        # intermediate files are written to tmp_dir rather than the data directory.
+        # save echo times in seconds to text files, as required by
+        # multiecho_thermometry. Most series share the same echo times, so
+        # write each unique set once and reuse the file
+        te_file_cache: dict[tuple[float, ...], Path] = {}
+        runs_te_files: list[list[Path]] = []
+        for run_series in runs_series:
+            te_files: list[Path] = []
+            for sd in run_series:
+                te_key = tuple(sd.te_ms)
+                if te_key not in te_file_cache:
+                    te_file = Path(tmp_dir) / f"te-{len(te_file_cache) + 1:02d}_s.txt"
+                    np.savetxt(te_file, sd.te_ms * 1e-3)
+                    te_file_cache[te_key] = te_file
+                te_files.append(te_file_cache[te_key])
+            runs_te_files.append(te_files)
+
+        run_results = list(
+            executor.map(
+                _process_run,
+                runs,
+                runs_series,
+                [data_dir] * len(run_jobs),
+                [method] * len(run_jobs),
+                [n_bootstrap] * len(run_jobs),
+                segmentation_files,
+                runs_te_files,
+                [plot] * len(run_jobs),
+            )
+        )
+
+    analysis_results = []
+    fibre_optic_sample_times: list[datetime] = []
+    fibre_optic_samples: list[float] = []
+    for run_result in run_results:
+        analysis_results.extend(run_result.region_results)
+        fibre_optic_sample_times.extend(run_result.fibre_optic_sample_times)
+        fibre_optic_samples.extend(run_result.fibre_optic_samples)
+
+    console.print(
+        f"[bold blue]Thermometry processing using method {method} complete[/bold blue]"
+    )
+
+    results_df = pd.DataFrame(analysis_results)
+
+    results_file = data_dir / f"thermometry_analysis_{method}.xlsx"
+    with pd.ExcelWriter(results_file, engine="xlsxwriter") as writer:
+        results_df.to_excel(writer, index=False)
+    # also save as parquet for downstream tooling that doesn't need Excel
+    results_df.to_parquet(results_file.with_suffix(".parquet"), index=False)
+    console.print(
+        f"[bold green]Analysis complete! Results saved to {results_file}[/bold green]"
+    )
+
+    if plot:
+        console.print("[bold blue]Saving plot to files[/bold blue]")
+        _plot_temperature_over_time(
+            results_df,
+            fibre_optic_sample_times,
+            fibre_optic_samples,
+            data_dir / f"thermometry_analysis_{method}",
+        )
 
 
 def main(data_dir: Path, method: Method) -> None:
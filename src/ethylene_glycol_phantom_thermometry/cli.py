@@ -6,7 +6,7 @@ from typing import Annotated
 
 import typer
 
-from ethylene_glycol_phantom_thermometry.analysis import Method, analysis
+from ethylene_glycol_phantom_thermometry.analysis import Method
 from ethylene_glycol_phantom_thermometry.util import get_project_root
 
 app = typer.Typer(pretty_exceptions_enable=False)
@@ -43,10 +43,20 @@ def main(
             min=1,
         ),
     ] = 10,
+    plot: Annotated[
+        bool,
+        typer.Option(
+            "--plot/--no-plot",
+            help="Save plots of the temperature distributions, signal fits and temperature over time",
+        ),
+    ] = False,
 ) -> None:
     """
     Run the ethylene glycol phantom thermometry analysis.
     """
+    # imported here so that the CLI starts quickly, e.g. for --help
+    from ethylene_glycol_phantom_thermometry.analysis import analysis
+
     project_root: Path = get_project_root()
     data_dir = project_root / "data" / dataset.value
     print(f"Constructed data directory path: {data_dir}")
@@ -55,7 +65,9 @@ def main(
         print(f"Error: Data directory not found at {data_dir}")
         raise typer.Exit(code=1)
 
-    analysis(data_dir=data_dir, method=method, n_bootstrap=bootstrap_iterations)
+    analysis(
+        data_dir=data_dir, method=method, n_bootstrap=bootstrap_iterations, plot=plot
+    )
 
 
 if __name__ == "__main__":
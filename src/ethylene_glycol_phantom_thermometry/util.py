@@ -1,45 +1,76 @@
 import ast  # Used to safely evaluate the string representation of the list
+import functools
 import json
 import os
 import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, cast
 
-import pandas as pd
-from pydantic import BaseModel, ConfigDict
+import numpy as np
+from pydantic import BaseModel, ConfigDict, field_validator
 
+# use orjson for decoding the BIDS sidecars if it is installed, as it is
+# considerably faster than the standard library
+_json_loads: Callable[[bytes], Any]
+try:
+    import orjson
 
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+@functools.lru_cache(maxsize=1)
 def get_project_root() -> Path:
     """
     Finds the project root directory by searching for a marker file (e.g., pyproject.toml).
 
+    The result is cached, so the filesystem is only searched once per process.
+
     Returns:
         The path to the project root directory.
+
+    Raises:
+        FileNotFoundError: If no parent directory contains a pyproject.toml.
     """
     # Start from the current file's directory and go up
     current_path = Path(__file__).resolve().parent
-    while current_path and not (current_path / "pyproject.toml").exists():
+    while not (current_path / "pyproject.toml").exists():
+        # the parent of the filesystem root is itself
+        if current_path.parent == current_path:
+            raise FileNotFoundError("Project root with 'pyproject.toml' not found.")
         current_path = current_path.parent
-    if not current_path:
-        raise FileNotFoundError("Project root with 'pyproject.toml' not found.")
     return current_path
 
 
 class SeriesData(BaseModel):
-    """A dataclass to hold study data."""
+    """A dataclass to hold study data.
+
+    te_ms is held as a float64 NumPy array, which pydantic compares with ==,
+    so comparing two SeriesData instances raises a ValueError.
+    """
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
     patient_name: str
     study_id: str
     series_no: int
     run: int
-    te_ms: list[float]
+    te_ms: np.ndarray
     nifti_file: Path | None = None
     duration: float | None = None
     segmentation: str = ""
     fo_temperature_start: float = -999.0
     fo_temperature_end: float = -999.0
 
+    @field_validator("te_ms", mode="before")
+    @classmethod
+    def _te_ms_as_array(cls, value: Any) -> np.ndarray:
+        """Converts the TE values, e.g. a list of floats, to a float64 array."""
+        return np.asarray(value, dtype=np.float64)
+
 
 @dataclass
 class BidsSidecar:
@@ -51,35 +82,87 @@ class BidsSidecar:
     sidecar: dict
 
 
+def _load_bids_sidecar(filename: Path) -> BidsSidecar:
+    """
+    Loads a single .json file into a BidsSidecar object.
+
+    Args:
+        filename: The path to the .json file.
+
+    Returns:
+        The BidsSidecar object.
+    """
+    data: dict = _json_loads(filename.read_bytes())
+
+    study_id = data.get("StudyInstanceUID", "unknown_study")
+    series_no = data.get("SeriesNumber", -1)
+
+    return BidsSidecar(
+        filename=filename,
+        study_id=study_id,
+        series_no=series_no,
+        sidecar=data,
+    )
+
+
 def load_bids_sidecars_from_directory(directory: Path) -> list[BidsSidecar]:
     """
     Finds all .json files in a directory, loads them into BidsSidecar objects.
     Assumes BIDS-like filenames, e.g., '..._ses-1_..._run-1_...json'
 
+    The files are read concurrently using a thread pool, starting as soon as
+    they are found rather than once the whole directory has been listed.
+
     Args:
         directory: The directory to search for .json files.
 
     Returns:
-        A list of BidsSidecar objects.
+        A list of BidsSidecar objects, sorted by filename.
     """
-    sidecar_files = list(directory.glob("*.json"))
-    sidecars = []
-    for p in sidecar_files:
-        with open(p) as f:
-            data: dict = json.load(f)
-
-        study_id = data.get("StudyInstanceUID", "unknown_study")
-        series_no = data.get("SeriesNumber", -1)
-
-        sidecars.append(
-            BidsSidecar(
-                filename=p,
-                study_id=study_id,
-                series_no=series_no,
-                sidecar=data,
-            )
-        )
-    return sidecars
+    with ThreadPoolExecutor() as executor:
+        sidecars = list(executor.map(_load_bids_sidecar, directory.glob("*.json")))
+    return sorted(sidecars, key=lambda sc: sc.filename)
+
+
+def find_nifti_for_sidecar(sidecar_file: Path) -> Path:
+    """
+    Finds the NIfTI image that accompanies a BIDS sidecar, assumed to have the
+    same name with a .nii or .nii.gz extension.
+
+    An uncompressed .nii is preferred when present, as it can be memory-mapped
+    when loaded rather than decompressed into memory in full.
+
+    Args:
+        sidecar_file: The path to the BIDS sidecar .json file.
+
+    Returns:
+        The path to the .nii file if it exists, otherwise the .nii.gz path.
+    """
+    nifti_file = sidecar_file.with_suffix(".nii")
+    if nifti_file.exists():
+        return nifti_file
+    return sidecar_file.with_suffix(".nii.gz")
+
+
+def _parse_te_ms(te_ms: str) -> list[float]:
+    """
+    Parses a string representation of a list of TE values, e.g. '[1.2, 3.4]'.
+
+    The string is parsed as JSON, falling back to safely evaluating it as a
+    Python literal if it is not valid JSON.
+
+    Args:
+        te_ms: The string representation of the list.
+
+    Returns:
+        The list of TE values.
+    """
+    te_ms_list: list[float]
+    try:
+        te_ms_list = json.loads(te_ms)
+    except json.JSONDecodeError:
+        te_ms_list = ast.literal_eval(te_ms)
+    return te_ms_list
 
 
 def load_series_info(filename: Path) -> list[SeriesData]:
@@ -97,37 +180,63 @@ def load_series_info(filename: Path) -> list[SeriesData]:
     - fo_temperature_start: The fibre optic temperature measurement at the start of the acquisition
     - fo_temperature_end: The fibre optic temperature measurement at the end of the acquisition
 
+    The parsed spreadsheet is cached alongside it as a Parquet file, which is
+    reused on subsequent calls for as long as it is newer than the spreadsheet.
+
     Args:
         filename: The path to the Excel file.
 
     Returns:
         A list of SeriesData objects.
     """
+    import pandas as pd
+    from pyarrow import ArrowException
+
     try:
-        # Read the Excel file into a pandas DataFrame
-        df = pd.read_excel(filename)
+        # Read the Excel file into a pandas DataFrame, via the Parquet cache
+        # if it is up to date. The cache is best-effort: if it can't be read or
+        # written, the spreadsheet is used directly.
+        cache_file = filename.with_suffix(".parquet")
+        df = None
+        if (
+            cache_file.exists()
+            and cache_file.stat().st_mtime >= filename.stat().st_mtime
+        ):
+            try:
+                df = pd.read_parquet(cache_file)
+            except (OSError, ArrowException) as e:
+                print(f"Warning: Could not read cache file '{cache_file}': {e}")
+        if df is None:
+            df = pd.read_excel(filename)
+            try:
+                df.to_parquet(cache_file, index=False)
+            except (OSError, ArrowException) as e:
+                # e.g. an object column that mixes types, which Parquet can't store
+                print(f"Warning: Could not write cache file '{cache_file}': {e}")
+                cache_file.unlink(missing_ok=True)
 
         series_records = []
 
         # Iterate over each row in the DataFrame
-        for index, row in df.iterrows():
-            # Safely parse the string '[1.2, 3.4]' into a list of floats
+        for row in df.itertuples(index=False):
+            # Parse the string '[1.2, 3.4]' into a list of floats
             te_ms_list = (
-                ast.literal_eval(row["te_ms"]) if isinstance(row["te_ms"], str) else []
+                _parse_te_ms(row.te_ms) if isinstance(row.te_ms, str) else []
             )
 
-            # Create a dataclass instance and append it to our list
+            # Create a dataclass instance and append it to our list. itertuples()
+            # types every field as any pandas scalar, hence the casts.
             record = SeriesData(
-                patient_name=row["patient_name"],
-                study_id=row["study_id"],
-                series_no=int(row["series_no"]),
-                run=int(row["run"]),
-                te_ms=te_ms_list,
-                duration=row["acquisition_duration"],
+                patient_name=cast(str, row.patient_name),
+                study_id=cast(str, row.study_id),
+                series_no=int(cast(float, row.series_no)),
+                run=int(cast(float, row.run)),
+                te_ms=np.asarray(te_ms_list, dtype=np.float64),
+                duration=cast(float, row.acquisition_duration),
                 nifti_file=None,
-                segmentation=row["valid_segmentation"],
-                fo_temperature_start=row["fo_temperature_start"],
-                fo_temperature_end=row["fo_temperature_end"],
+                segmentation=cast(str, row.valid_segmentation),
+                fo_temperature_start=cast(float, row.fo_temperature_start),
+                fo_temperature_end=cast(float, row.fo_temperature_end),
             )
             series_records.append(record)
 
@@ -167,9 +276,7 @@ def export_unique_te_arrays(
     # Loop through the unique arrays and save each to a file
     for i, te_tuple in enumerate(unique_arrays, 1):
         filename = os.path.join(output_dir, f"unique_te_{i}.txt")
-        with open(filename, "w") as f:
-            for value in te_tuple:
-                f.write(f"{value}\n")
+        np.savetxt(filename, te_tuple)
         print(f" -> Saved {filename}")
 
 
@@ -200,4 +307,3 @@ if __name__ == "__main__":
 
     # Export unique te_ms arrays
     export_unique_te_arrays(data_list, excel_dir, te_units="s")
-    # pdb.set_trace()